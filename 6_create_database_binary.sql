@@ -0,0 +1,77 @@
+-- Binary key variant of 1_create_database.sql
+-- The 32-character hex IDs are stored as BINARY(16) (UNHEX on load, HEX on read)
+CREATE DATABASE olist_ecommerce_bin;
+USE olist_ecommerce_bin;
+
+-- Customers table
+CREATE TABLE customers (
+    customer_id BINARY(16) PRIMARY KEY,
+    customer_unique_id VARCHAR(32),
+    customer_zip_code_prefix INT,
+    customer_city VARCHAR(255),
+    customer_state VARCHAR(2)
+);
+
+-- Orders table
+CREATE TABLE orders (
+    order_id BINARY(16) PRIMARY KEY,
+    customer_id BINARY(16),
+    order_status VARCHAR(50),
+    order_purchase_timestamp DATETIME,
+    order_approved_at DATETIME,
+    order_delivered_carrier_date DATETIME,
+    order_delivered_customer_date DATETIME,
+    order_estimated_delivery_date DATETIME,
+    FOREIGN KEY (customer_id) REFERENCES customers(customer_id)
+);
+
+-- Order payments table
+CREATE TABLE order_payments (
+    order_id BINARY(16),
+    payment_sequential INT,
+    payment_type VARCHAR(50),
+    payment_installments INT,
+    payment_value DECIMAL(10, 2),
+    PRIMARY KEY (order_id, payment_sequential),
+    FOREIGN KEY (order_id) REFERENCES orders(order_id)
+);
+
+-- Order reviews table (for full-text search)
+CREATE TABLE order_reviews (
+    review_id BINARY(16) PRIMARY KEY,
+    order_id BINARY(16),
+    review_score INT,
+    review_comment_title TEXT,
+    review_comment_message TEXT,
+    review_creation_date DATETIME,
+    review_answer_timestamp DATETIME,
+    FOREIGN KEY (order_id) REFERENCES orders(order_id),
+    FULLTEXT (review_comment_title, review_comment_message)
+);
+
+-- Read views: same columns as the VARCHAR layout, IDs shown as lowercase hex
+CREATE VIEW customers_hex AS
+SELECT LOWER(HEX(customer_id)) AS customer_id, customer_unique_id,
+       customer_zip_code_prefix, customer_city, customer_state
+FROM customers;
+
+CREATE VIEW orders_hex AS
+SELECT LOWER(HEX(order_id)) AS order_id, LOWER(HEX(customer_id)) AS customer_id,
+       order_status, order_purchase_timestamp, order_approved_at,
+       order_delivered_carrier_date, order_delivered_customer_date,
+       order_estimated_delivery_date
+FROM orders;
+
+CREATE VIEW order_payments_hex AS
+SELECT LOWER(HEX(order_id)) AS order_id, payment_sequential, payment_type,
+       payment_installments, payment_value
+FROM order_payments;
+
+CREATE VIEW order_reviews_hex AS
+SELECT LOWER(HEX(review_id)) AS review_id, LOWER(HEX(order_id)) AS order_id,
+       review_score, review_comment_title, review_comment_message,
+       review_creation_date, review_answer_timestamp
+FROM order_reviews;
+
+-- Show tables and views created
+SHOW FULL TABLES;
@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+Compare VARCHAR(32) and BINARY(16) key storage
+Reloads both layouts and reports table/index sizes, buffer pool footprint,
+load time and JOIN latency side by side
+"""
+
+import importlib
+import sys
+from collections import Counter
+import mysql.connector
+import pandas as pd
+import time
+
+VARCHAR_DB = 'olist_ecommerce'
+BINARY_DB = 'olist_ecommerce_bin'
+
+# Loader script for each layout (2_load_data.py and 7_load_data_binary.py)
+LOADERS = {
+    VARCHAR_DB: '2_load_data',
+    BINARY_DB: '7_load_data_binary',
+}
+
+TABLES = ['customers', 'orders', 'order_payments', 'order_reviews']
+
+# Tables read by the JOIN - only these count towards the buffer pool figures
+JOIN_TABLES = ['customers', 'orders', 'order_payments']
+
+CSV_FILES = [
+    'datasets/olist_customers_dataset.csv',
+    'datasets/olist_orders_dataset.csv',
+    'datasets/olist_order_payments_dataset.csv',
+    'datasets/olist_order_reviews_dataset.csv',
+]
+
+# Each run loads and measures both layouts, swapping which one goes first,
+# so keep this even to give both layouts the same number of first places
+RUNS = 2
+
+# Scratch table used to push the JOIN tables out of the buffer pool
+FILLER_DB = 'olist_buffer_filler'
+FILLER_ROW_BYTES = 255
+
+# Same JOIN as Step 3 - the text is identical for both layouts
+JOIN_QUERY = """
+    SELECT c.customer_state, AVG(p.payment_value) as avg_payment
+    FROM customers c
+    JOIN orders o ON c.customer_id = o.customer_id
+    JOIN order_payments p ON o.order_id = p.order_id
+    GROUP BY c.customer_state
+    ORDER BY avg_payment DESC
+    LIMIT 5
+    """
+
+def connect_db(database):
+    """Connect to database"""
+    return mysql.connector.connect(
+        host='127.0.0.1',
+        user='root',
+        password='Secret5555',
+        database=database
+    )
+
+def index_definitions(database):
+    """Return {(table, index): definition} from information_schema
+
+    A definition is (table, is_primary, non_unique, index_type, parts) with
+    one (column, prefix length) part per indexed column. It leaves out the
+    index name, so the automatic foreign key index and a Step 5 index on the
+    same column compare as the same index.
+    """
+    conn = connect_db(database)
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        SELECT TABLE_NAME, INDEX_NAME, NON_UNIQUE, INDEX_TYPE,
+               COLUMN_NAME, SUB_PART, EXPRESSION
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = %s
+        ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+    """, (database,))
+    rows = cursor.fetchall()
+
+    cursor.close()
+    conn.close()
+
+    parts = {}
+    details = {}
+    for table, index, non_unique, index_type, column, sub_part, expression in rows:
+        # Functional indexes have no column to copy, so they are left to the user
+        if expression is not None:
+            sys.exit(f"Index {index} on {database}.{table} is an expression index - "
+                     "make the index sets match by hand before comparing")
+        parts.setdefault((table, index), []).append((column, sub_part))
+        details[(table, index)] = (index == 'PRIMARY', int(non_unique), index_type)
+
+    return {(table, index): (table, *details[(table, index)], tuple(parts[(table, index)]))
+            for table, index in parts}
+
+def create_index(database, index, definition):
+    """Create an index copied from the other layout"""
+    table, is_primary, non_unique, index_type, parts = definition
+    if index_type == 'FULLTEXT':
+        kind = 'FULLTEXT '
+    elif not non_unique:
+        kind = 'UNIQUE '
+    else:
+        kind = ''
+    column_list = ", ".join(f"`{column}`({sub_part})" if sub_part else f"`{column}`"
+                            for column, sub_part in parts)
+
+    conn = connect_db(database)
+    cursor = conn.cursor()
+    print(f"Creating index {index} on {database}.{table}")
+    cursor.execute(f"CREATE {kind}INDEX `{index}` ON `{table}` ({column_list})")
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+def missing_indexes(source, target):
+    """Return [(index, definition)] present on source with no match on target"""
+    source_indexes = index_definitions(source)
+    target_indexes = index_definitions(target)
+    missing = Counter(source_indexes.values()) - Counter(target_indexes.values())
+
+    to_create = []
+    for definition, count in missing.items():
+        if definition[1]:
+            sys.exit(f"Primary keys of {definition[0]} differ between the layouts")
+        # Reuse the source name unless the target already has an index called that
+        names = [index for (table, index), other in source_indexes.items()
+                 if other == definition and (table, index) not in target_indexes]
+        if len(names) < count:
+            sys.exit(f"Cannot copy index {definition} from {source} to {target}: "
+                     "an index with the same name and a different definition exists")
+        to_create.extend((index, definition) for index in names[:count])
+    return to_create
+
+def match_indexes():
+    """Give both layouts the same index set so they differ only in key type
+
+    Step 5 adds its indexes to olist_ecommerce only. Indexes are matched by
+    definition, and any index one layout lacks is created there. Creating an
+    index can make MySQL drop an automatic foreign key index, so both sets are
+    read again afterwards and the comparison stops if they still differ.
+    """
+    print("\nChecking index sets")
+    print("-" * 50)
+
+    for source, target in ((VARCHAR_DB, BINARY_DB), (BINARY_DB, VARCHAR_DB)):
+        for index, definition in missing_indexes(source, target):
+            create_index(target, index, definition)
+
+    varchar = Counter(index_definitions(VARCHAR_DB).values())
+    binary = Counter(index_definitions(BINARY_DB).values())
+    if varchar != binary:
+        for definition in sorted((varchar - binary).keys(), key=str):
+            print(f"Only on {VARCHAR_DB}: {definition}")
+        for definition in sorted((binary - varchar).keys(), key=str):
+            print(f"Only on {BINARY_DB}: {definition}")
+        sys.exit("Index sets still differ between the layouts - fix them before comparing")
+
+    print("Both layouts have the same indexes")
+
+def warm_up():
+    """Import both loaders and read every CSV once before anything is timed
+
+    Without this the first layout loaded pays for the cold OS file cache and
+    the pandas/loader imports, which always favours the second one.
+    """
+    for module in LOADERS.values():
+        importlib.import_module(module)
+    for path in CSV_FILES:
+        pd.read_csv(path)
+
+def time_load(database):
+    """Empty the tables of a layout and reload them, returning the load time"""
+    conn = connect_db(database)
+    cursor = conn.cursor()
+
+    # TRUNCATE refuses tables referenced by a foreign key unless checks are off
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+    for table in reversed(TABLES):
+        cursor.execute(f"TRUNCATE TABLE {table}")
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+    cursor.close()
+    conn.close()
+
+    loader = importlib.import_module(LOADERS[database])
+
+    print(f"\nLoading {database}")
+    print("-" * 50)
+    start_time = time.time()
+    loader.load_customers()
+    loader.load_orders()
+    loader.load_payments()
+    loader.load_reviews()
+    end_time = time.time()
+
+    load_time = end_time - start_time
+    print(f"Load time: {load_time:.2f} seconds")
+    return load_time
+
+def time_join(database):
+    """Run the JOIN query 3 times and return the average time"""
+    conn = connect_db(database)
+    cursor = conn.cursor()
+
+    times = []
+    for i in range(3):
+        start_time = time.time()
+        cursor.execute(JOIN_QUERY)
+        cursor.fetchall()
+        end_time = time.time()
+        times.append(end_time - start_time)
+
+    cursor.close()
+    conn.close()
+    return sum(times) / len(times)
+
+def table_sizes(database):
+    """Return {table: (data_bytes, index_bytes)} from information_schema"""
+    conn = connect_db(database)
+    cursor = conn.cursor()
+
+    # Refresh the cached statistics so the sizes reflect the fresh load
+    cursor.execute("SET SESSION information_schema_stats_expiry = 0")
+    for table in TABLES:
+        cursor.execute(f"ANALYZE TABLE {table}")
+        cursor.fetchall()
+
+    cursor.execute("""
+        SELECT TABLE_NAME, DATA_LENGTH, INDEX_LENGTH
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE'
+    """, (database,))
+    sizes = {name: (data, index) for name, data, index in cursor.fetchall()}
+
+    cursor.close()
+    conn.close()
+    return sizes
+
+def buffer_pool_usage(database):
+    """Return (pages, bytes) of the JOIN tables resident in the buffer pool"""
+    conn = connect_db(database)
+    cursor = conn.cursor()
+
+    # TABLE_NAME is reported as `schema`.`table`; order_reviews and its
+    # FULLTEXT helper tables are the same in both layouts and are left out
+    buffer_tables = [f"`{database}`.`{table}`" for table in JOIN_TABLES]
+    placeholders = ", ".join(["%s"] * len(buffer_tables))
+    cursor.execute(f"""
+        SELECT COUNT(*), COALESCE(SUM(DATA_SIZE), 0)
+        FROM information_schema.INNODB_BUFFER_PAGE
+        WHERE TABLE_NAME IN ({placeholders})
+    """, buffer_tables)
+    pages, data_bytes = cursor.fetchone()
+
+    cursor.close()
+    conn.close()
+    return pages, int(data_bytes)
+
+def create_filler():
+    """Create a scratch table twice the size of the buffer pool"""
+    conn = connect_db(None)
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT @@innodb_buffer_pool_size")
+    pool_size = cursor.fetchone()[0]
+    target_rows = pool_size * 2 // FILLER_ROW_BYTES
+    print(f"\nCreating {FILLER_DB}.filler ({mb(pool_size * 2)}) to evict the buffer pool")
+
+    cursor.execute(f"CREATE DATABASE IF NOT EXISTS {FILLER_DB}")
+    cursor.execute(f"DROP TABLE IF EXISTS {FILLER_DB}.filler")
+    cursor.execute(f"""
+        CREATE TABLE {FILLER_DB}.filler (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            pad CHAR({FILLER_ROW_BYTES}) CHARACTER SET latin1 NOT NULL
+        )
+    """)
+    cursor.execute(f"INSERT INTO {FILLER_DB}.filler (pad) VALUES (REPEAT('x', {FILLER_ROW_BYTES}))")
+
+    # Double the table until it holds enough rows
+    rows = 1
+    while rows < target_rows:
+        cursor.execute(f"INSERT INTO {FILLER_DB}.filler (pad) SELECT pad FROM {FILLER_DB}.filler")
+        conn.commit()
+        rows *= 2
+
+    cursor.close()
+    conn.close()
+
+def drop_filler():
+    """Remove the scratch database"""
+    conn = connect_db(None)
+    cursor = conn.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS {FILLER_DB}")
+    cursor.close()
+    conn.close()
+
+def evict_buffer_pool():
+    """Push every other page out of the buffer pool by scanning the filler table
+
+    A plain scan is kept in the old sublist and would not evict hot pages, so
+    innodb_old_blocks_time is set to 0 to promote the filler pages to young.
+    """
+    conn = connect_db(None)
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT @@GLOBAL.innodb_old_blocks_time")
+    old_blocks_time = cursor.fetchone()[0]
+    cursor.execute("SET GLOBAL innodb_old_blocks_time = 0")
+    try:
+        for i in range(2):
+            cursor.execute(f"SELECT SUM(LENGTH(pad)) FROM {FILLER_DB}.filler")
+            cursor.fetchall()
+    finally:
+        cursor.execute(f"SET GLOBAL innodb_old_blocks_time = {int(old_blocks_time)}")
+
+    cursor.close()
+    conn.close()
+
+def cold_join_footprint(database):
+    """Run the JOIN once on an evicted buffer pool and count the pages it read in"""
+    evict_buffer_pool()
+    leftover_pages, _ = buffer_pool_usage(database)
+    if leftover_pages:
+        print(f"Warning: {leftover_pages} pages of {database} still cached after eviction")
+
+    conn = connect_db(database)
+    cursor = conn.cursor()
+    cursor.execute(JOIN_QUERY)
+    cursor.fetchall()
+    cursor.close()
+    conn.close()
+
+    pages, data_bytes = buffer_pool_usage(database)
+    print(f"JOIN footprint: {pages} pages, {mb(data_bytes)}")
+    return pages, data_bytes
+
+def measure_layout(database):
+    """Load one layout, then measure the JOIN's buffer pool footprint and latency"""
+    load_time = time_load(database)
+    footprint = cold_join_footprint(database)
+    # The timed runs come after the cold run, so they measure a warm pool
+    join_time = time_join(database)
+    return {
+        'load_time': load_time,
+        'join_time': join_time,
+        'footprint': footprint,
+    }
+
+def mb(size):
+    """Format a byte count as MB"""
+    return f"{size / 1024 / 1024:.2f} MB"
+
+def change(before, after):
+    """Percentage change from the VARCHAR to the BINARY layout"""
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+def average(values):
+    """Average of a list of numbers"""
+    return sum(values) / len(values)
+
+def compare_layouts():
+    """Measure both layouts and print the comparison report"""
+    match_indexes()
+    warm_up()
+    create_filler()
+
+    runs = {VARCHAR_DB: [], BINARY_DB: []}
+    try:
+        for run in range(RUNS):
+            # Alternate which layout goes first so neither always gets the warmer cache
+            order = (VARCHAR_DB, BINARY_DB) if run % 2 == 0 else (BINARY_DB, VARCHAR_DB)
+            print(f"\n\nRUN {run + 1} of {RUNS}: {order[0]} first")
+            print("="*50)
+            for database in order:
+                runs[database].append(measure_layout(database))
+    finally:
+        drop_filler()
+
+    results = {}
+    for database, measurements in runs.items():
+        results[database] = {
+            'load_avg': average([m['load_time'] for m in measurements]),
+            'load_best': min(m['load_time'] for m in measurements),
+            'join_avg': average([m['join_time'] for m in measurements]),
+            'join_best': min(m['join_time'] for m in measurements),
+            'join_pages': average([m['footprint'][0] for m in measurements]),
+            'join_bytes': average([m['footprint'][1] for m in measurements]),
+            'sizes': table_sizes(database),
+        }
+
+    varchar = results[VARCHAR_DB]
+    binary = results[BINARY_DB]
+
+    print("\n\n" + "="*70)
+    print("TABLE AND INDEX SIZES: VARCHAR(32) vs BINARY(16)")
+    print("="*70)
+    print(f"{'Table':<16} {'Part':<6} {'VARCHAR(32)':<14} {'BINARY(16)':<14} {'Change':<10}")
+    print("-" * 70)
+    for table in TABLES:
+        v_data, v_index = varchar['sizes'].get(table, (0, 0))
+        b_data, b_index = binary['sizes'].get(table, (0, 0))
+        print(f"{table:<16} {'data':<6} {mb(v_data):<14} {mb(b_data):<14} {change(v_data, b_data):<10}")
+        print(f"{'':<16} {'index':<6} {mb(v_index):<14} {mb(b_index):<14} {change(v_index, b_index):<10}")
+
+    v_total = sum(d + i for d, i in varchar['sizes'].values())
+    b_total = sum(d + i for d, i in binary['sizes'].values())
+    print("-" * 70)
+    print(f"{'Total':<23} {mb(v_total):<14} {mb(b_total):<14} {change(v_total, b_total):<10}")
+
+    print("\n" + "="*70)
+    print(f"BUFFER POOL, LOAD AND JOIN: VARCHAR(32) vs BINARY(16) (average of {RUNS} runs)")
+    print("="*70)
+    print(f"{'Metric':<32} {'VARCHAR(32)':<14} {'BINARY(16)':<14} {'Change':<10}")
+    print("-" * 70)
+    rows = [
+        ("JOIN buffer pool pages (cold)", 'join_pages', lambda v: f"{v:.0f}"),
+        ("JOIN buffer pool data (cold)", 'join_bytes', mb),
+        ("Load time avg (s)", 'load_avg', lambda v: f"{v:.2f}"),
+        ("Load time best (s)", 'load_best', lambda v: f"{v:.2f}"),
+        ("JOIN latency avg (s)", 'join_avg', lambda v: f"{v:.4f}"),
+        ("JOIN latency best (s)", 'join_best', lambda v: f"{v:.4f}"),
+    ]
+    for label, key, fmt in rows:
+        print(f"{label:<32} {fmt(varchar[key]):<14} {fmt(binary[key]):<14} "
+              f"{change(varchar[key], binary[key]):<10}")
+
+    print("\nBuffer pool figures are the customers, orders and order_payments pages")
+    print("read in by one JOIN after the pool was evicted.")
+
+    return results
+
+if __name__ == "__main__":
+    print("="*60)
+    print("STEP 8: KEY STORAGE COMPARISON (VARCHAR(32) vs BINARY(16))")
+    print("="*60)
+
+    compare_layouts()
+
+    print("\n✅ Step 8 completed: Key storage layouts compared")